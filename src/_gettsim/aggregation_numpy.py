@@ -6,9 +6,7 @@ import numpy_groupies as npg
 
 def grouped_count(group_id):
     fail_if_dtype_of_group_id_not_int(group_id, agg_func="count")
-    out_on_hh = npg.aggregate(
-        group_id, numpy.ones(len(group_id)), func="sum", fill_value=0
-    )
+    out_on_hh = numpy.bincount(group_id).astype(float)
 
     out = out_on_hh[group_id]
     return out
@@ -18,7 +16,17 @@ def grouped_sum(column, group_id):
     fail_if_dtype_of_group_id_not_int(group_id, agg_func="sum")
     fail_if_dtype_not_numeric_or_boolean(column, agg_func="sum")
 
-    out_on_hh = npg.aggregate(group_id, column, func="sum", fill_value=0)
+    # numpy_groupies sums booleans to int8, which overflows quickly in subsequent
+    # computations.
+    if column.dtype == bool:
+        column = column.astype(int)
+
+    # numpy.bincount sums in a single pass, but always returns floats. Hence, it is
+    # only used for float columns.
+    if numpy.issubdtype(column.dtype, numpy.floating):
+        out_on_hh = numpy.bincount(group_id, weights=column)
+    else:
+        out_on_hh = npg.aggregate(group_id, column, func="sum", fill_value=0)
 
     # Expand to individual level
     out = out_on_hh[group_id]
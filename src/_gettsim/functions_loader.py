@@ -367,7 +367,66 @@ def _create_aggregation_functions(
         )
         for agg_col, agg_spec in aggregation_dict.items()
     }
-    return aggregation_functions
+
+    # Add functions which map the group ids to the consecutive codes used by the
+    # aggregation functions.
+    group_id_code_functions = {
+        f"_{g}_id_code": _create_group_id_code_func(g) for g in SUPPORTED_GROUPINGS
+    }
+
+    return {**aggregation_functions, **group_id_code_functions}
+
+
+def _create_group_id_code_func(group):
+    """Create a function which maps the ids of a group to consecutive codes.
+
+    The aggregation functions use the group ids as positions. Hence, arbitrary ids,
+    e.g., 10^9 for a household, would let them allocate arrays with as many entries.
+    The codes are computed once per group and only used by the aggregation functions.
+    The id columns themselves remain unchanged.
+
+    Parameters
+    ----------
+    group : str
+        Name of the group, e.g., "hh".
+
+    Returns
+    -------
+    group_id_code_func : The function with the expected signature
+
+    """
+    group_id = f"{group}_id"
+
+    @rename_arguments(
+        mapper={"group_id": group_id}, annotations={group_id: int, "return": int}
+    )
+    def group_id_code_func(group_id):
+        return _reorder_ids(group_id)
+
+    return group_id_code_func
+
+
+def _reorder_ids(ids):
+    """Make ids consecutive from 0 to n - 1, preserving their order.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        Array of ids.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the same length where the smallest id is 0, the next one 1, and so
+        on.
+
+    Examples
+    --------
+    >>> _reorder_ids(numpy.array([7, 3, 7, 100]))
+    array([1, 0, 1, 2])
+
+    """
+    return numpy.unique(ids, return_inverse=True)[1].reshape(ids.shape)
 
 
 def rename_arguments(func=None, mapper=None, annotations=None):
@@ -445,11 +504,12 @@ def _create_one_aggregation_func(  # noqa: PLR0912
                 f"Source_col is not specified for aggregation column {agg_col}."
             ) from e
 
-    # Identify grouping level
+    # Identify grouping level. The aggregation uses the consecutive codes of the group
+    # ids, see _create_group_id_code_func.
     group_id = None
     for g in SUPPORTED_GROUPINGS:
         if agg_col.endswith(f"_{g}"):
-            group_id = f"{g}_id"
+            group_id = f"_{g}_id_code"
     if not group_id:
         raise ValueError(
             "Name of aggregated column needs to have a suffix "
@@ -571,6 +631,10 @@ def _select_return_type(aggr, source_col_type):
 
 
 def _vectorize_func(func):
+    # Functions written for arrays are used as they are.
+    if getattr(func, "__info__", {}).get("skip_vectorization", False):
+        return func
+
     # What should work once that Jax backend is fully supported
     signature = inspect.signature(func)
     func_vec = numpy.vectorize(func)
@@ -4,6 +4,7 @@ import inspect
 import warnings
 
 import dags
+import numpy
 import pandas as pd
 
 from _gettsim.config import DEFAULT_TARGETS, SUPPORTED_GROUPINGS, TYPES_INPUT_VARIABLES
@@ -235,8 +236,8 @@ def _process_and_check_data(data, columns_overriding_functions):
     # unit within a household.
     # ToDo: Remove check once Günstigerprüfung ist taken care of.
     if ("tu_id" in data) and ("hh_id" in data):
-        assert (
-            not data["tu_id"].groupby(data["hh_id"]).std().max() > 0
+        assert _is_constant_within_groups(
+            data["tu_id"].to_numpy(), data["hh_id"].to_numpy()
         ), "We currently allow for only one tax unit within each household"
 
     _fail_if_columns_overriding_functions_are_not_in_data(
@@ -362,13 +363,37 @@ def _create_input_data(
     data = _reduce_to_necessary_data(root_nodes, data, check_minimal_specification)
 
     # Convert series to numpy arrays
-    data = {key: series.values for key, series in data.items()}
+    data = {key: _convert_series_to_numpy(series) for key, series in data.items()}
 
     # Restrict to root nodes
     input_data = {k: v for k, v in data.items() if k in root_nodes}
     return input_data
 
 
+def _convert_series_to_numpy(series):
+    """Convert a series to a NumPy array.
+
+    Series with pandas' nullable dtypes (e.g., "Int64") are converted to the
+    corresponding NumPy dtype if they do not contain missing values. Otherwise,
+    functions operating on whole arrays would receive arrays of dtype object.
+
+    Arrays are made contiguous in memory once here, so that no function of the DAG
+    operates on strided views, e.g., of a column of a DataFrame created from a
+    two-dimensional array.
+
+    """
+    numpy_dtype = getattr(series.dtype, "numpy_dtype", None)
+    if numpy_dtype is not None and not series.hasnans:
+        out = series.to_numpy(dtype=numpy_dtype)
+    else:
+        out = series.values
+
+    if isinstance(out, numpy.ndarray):
+        out = numpy.ascontiguousarray(out)
+
+    return out
+
+
 def _fail_if_duplicates_in_columns(data):
     """Check that all column names are unique."""
     if any(data.columns.duplicated()):
@@ -390,8 +415,9 @@ def _fail_if_group_variables_not_constant_within_groups(data):
     for name, col in data.items():
         for level in SUPPORTED_GROUPINGS:
             if name.endswith(f"_{level}"):
-                max_value = col.groupby(data[f"{level}_id"]).transform("max")
-                if not (max_value == col).all():
+                if col.hasnans or not _is_constant_within_groups(
+                    col.to_numpy(), data[f"{level}_id"].to_numpy()
+                ):
                     message = format_errors_and_warnings(
                         f"""
                         Column {name!r} has not one unique value per group defined by
@@ -407,6 +433,34 @@ def _fail_if_group_variables_not_constant_within_groups(data):
     return data
 
 
+def _is_constant_within_groups(values, group_ids):
+    """Check whether an array has the same value within each group.
+
+    Sorting by group puts all members of a group next to each other. Then, it suffices
+    to compare neighboring values within the same group.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Array of values.
+    group_ids : numpy.ndarray
+        Array of group ids with the same length as ``values``.
+
+    Returns
+    -------
+    bool
+
+    """
+    order = numpy.argsort(group_ids, kind="stable")
+    sorted_ids = group_ids[order]
+    sorted_values = values[order]
+
+    same_group = sorted_ids[1:] == sorted_ids[:-1]
+    different_value = sorted_values[1:] != sorted_values[:-1]
+
+    return not numpy.any(same_group & different_value)
+
+
 def _fail_if_columns_overriding_functions_are_not_in_data(data_cols, columns):
     """Fail if functions which compute columns overlap with existing columns.
 
@@ -8,8 +8,8 @@ def piecewise_polynomial(
 
     Parameters
     ----------
-    x : pd.Series
-        Series with values which piecewise polynomial is applied to.
+    x : float or numpy.ndarray
+        Value or array of values which piecewise polynomial is applied to.
     thresholds : numpy.array
                 A one-dimensional array containing the thresholds for all intervals.
     rates : numpy.ndarray
@@ -23,7 +23,7 @@ def piecewise_polynomial(
 
     Returns
     -------
-    out : float
+    out : float or numpy.ndarray
         The value of `x` under the piecewise function.
 
     """
@@ -37,8 +37,16 @@ def piecewise_polynomial(
     # Calc last threshold for each individual
     threshold = thresholds[selected_bin]
 
-    # Increment for each individual in the corresponding interval.
-    increment_to_calc = x - threshold
+    # Scalars, e.g. from vectorized callers, take the cheaper branches below instead
+    # of calls to numpy.where. numpy.searchsorted returns a scalar for them.
+    is_scalar = not isinstance(selected_bin, numpy.ndarray)
+
+    # Increment for each individual in the corresponding interval. It is set to zero in
+    # the first interval as its lower threshold is usually -inf.
+    if is_scalar:
+        increment_to_calc = x - threshold
+    else:
+        increment_to_calc = numpy.where(selected_bin > 0, x - threshold, 0)
 
     # If each individual has its own rates or the rates are scaled, we can't use the
     # intercept, which was generated in the parameter loading.
@@ -52,9 +60,20 @@ def piecewise_polynomial(
             for pol in range(1, degree_polynomial + 1):
                 # We only calculate the intercepts for individuals who are in this or
                 # higher interval. Hence we have to use the individual rates.
-                if selected_bin >= i:
-                    out += (
-                        rates_multiplier * rates[pol - 1, i - 1] * threshold_incr**pol
+                if is_scalar:
+                    if selected_bin >= i:
+                        out += (
+                            rates_multiplier
+                            * rates[pol - 1, i - 1]
+                            * threshold_incr**pol
+                        )
+                else:
+                    out = out + numpy.where(
+                        selected_bin >= i,
+                        rates_multiplier
+                        * rates[pol - 1, i - 1]
+                        * threshold_incr**pol,
+                        0,
                     )
 
     # If rates remain the same, everything is a lot easier.
@@ -65,14 +84,15 @@ def piecewise_polynomial(
     # Intialize a multiplyer for 1 if it is not given.
     rates_multiplier = 1 if rates_multiplier is None else rates_multiplier
 
-    if selected_bin > 0:
-        # Now add the evaluation of the increment
-        for pol in range(1, degree_polynomial + 1):
-            out += (
-                rates[pol - 1][selected_bin]
-                * rates_multiplier
-                * (increment_to_calc**pol)
-            )
+    # Now add the evaluation of the increment. Scalars in or below the first interval
+    # keep the intercept.
+    if is_scalar and selected_bin <= 0:
+        return out
+
+    for pol in range(1, degree_polynomial + 1):
+        out = out + (
+            rates[pol - 1][selected_bin] * rates_multiplier * (increment_to_calc**pol)
+        )
 
     return out
 
@@ -352,7 +372,7 @@ def calculate_intercepts(
 
     Returns
     -------
-    out : float
+    out : float or numpy.ndarray
         The value of `x` under the piecewise function.
 
     """
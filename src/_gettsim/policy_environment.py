@@ -262,9 +262,8 @@ def _parse_einführungsfaktor_vorsorgeaufw_alter_ab_2005(date, params):
     """
     jahr = float(date.year)
     if jahr >= 2005:
-        # ToDo: remove conversion to Series after moving to scalar
         out = piecewise_polynomial(
-            pd.Series(jahr),
+            x=jahr,
             thresholds=params["eink_st_abzuege"]["einführungsfaktor"]["thresholds"],
             rates=params["eink_st_abzuege"]["einführungsfaktor"]["rates"],
             intercepts_at_lower_thresholds=params["eink_st_abzuege"][
@@ -273,7 +272,7 @@ def _parse_einführungsfaktor_vorsorgeaufw_alter_ab_2005(date, params):
         )
         params["eink_st_abzuege"][
             "einführungsfaktor_vorsorgeaufw_alter_ab_2005"
-        ] = out.loc[0]
+        ] = float(out)
     return params
 
 
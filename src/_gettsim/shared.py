@@ -42,6 +42,31 @@ def add_rounding_spec(params_key):
     return inner
 
 
+def skip_vectorization(func):
+    """Decorator marking a function as operating on arrays already.
+
+    By default, GETTSIM functions are written for scalars and vectorized during the set
+    up of the DAG. Functions with this decorator are called with the full arrays
+    instead, which avoids one Python call per row.
+
+    Parameters
+    ----------
+    func : function
+        Function which accepts and returns arrays.
+
+    Returns
+    -------
+    func : function
+        Function with __info__["skip_vectorization"] attribute
+
+    """
+    if not hasattr(func, "__info__"):
+        func.__info__ = {}
+    func.__info__["skip_vectorization"] = True
+
+    return func
+
+
 TIME_DEPENDENT_FUNCTIONS: dict[str, list[Callable]] = {}
 
 
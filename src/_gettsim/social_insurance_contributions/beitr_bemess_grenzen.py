@@ -1,3 +1,8 @@
+from _gettsim.config import numpy_or_jax as np
+from _gettsim.shared import skip_vectorization
+
+
+@skip_vectorization
 def _ges_rentenv_beitr_bemess_grenze_m(
     wohnort_ost: bool, soz_vers_beitr_params: dict
 ) -> float:
@@ -15,11 +20,13 @@ def _ges_rentenv_beitr_bemess_grenze_m(
 
     """
     params = soz_vers_beitr_params["beitr_bemess_grenze_m"]["ges_rentenv"]
-    out = params["ost"] if wohnort_ost else params["west"]
 
-    return float(out)
+    out = np.where(wohnort_ost, float(params["ost"]), float(params["west"]))
 
+    return out
 
+
+@skip_vectorization
 def _ges_krankenv_beitr_bemess_grenze_m(
     wohnort_ost: bool, soz_vers_beitr_params: dict
 ) -> float:
@@ -39,11 +46,12 @@ def _ges_krankenv_beitr_bemess_grenze_m(
     """
     params = soz_vers_beitr_params["beitr_bemess_grenze_m"]["ges_krankenv"]
 
-    out = params["ost"] if wohnort_ost else params["west"]
+    out = np.where(wohnort_ost, float(params["ost"]), float(params["west"]))
 
-    return float(out)
+    return out
 
 
+@skip_vectorization
 def _ges_krankenv_bezugsgröße_selbst_m(
     wohnort_ost: bool, soz_vers_beitr_params: dict
 ) -> float:
@@ -63,10 +71,8 @@ def _ges_krankenv_bezugsgröße_selbst_m(
     -------
 
     """
-    out = (
-        soz_vers_beitr_params["bezugsgröße_selbst_m"]["ost"]
-        if wohnort_ost
-        else soz_vers_beitr_params["bezugsgröße_selbst_m"]["west"]
-    )
+    params = soz_vers_beitr_params["bezugsgröße_selbst_m"]
+
+    out = np.where(wohnort_ost, float(params["ost"]), float(params["west"]))
 
-    return float(out)
+    return out
@@ -1,5 +1,5 @@
 from _gettsim.piecewise_functions import piecewise_polynomial
-from _gettsim.shared import add_rounding_spec
+from _gettsim.shared import add_rounding_spec, skip_vectorization
 
 
 def eink_st_ohne_kinderfreib_tu(
@@ -138,6 +138,29 @@ def eink_st_tu_ab_1997(
     return out
 
 
+@skip_vectorization
+def _eink_st_erwachsener_m(eink_st_tu: float, anz_erwachsene_tu: int) -> float:
+    """Calculate the monthly income tax per adult.
+
+    The income tax is split equally between the adults of the tax unit. The result is
+    used to compute net incomes for several transfers.
+
+    Parameters
+    ----------
+    eink_st_tu
+        See :func:`eink_st_tu`.
+    anz_erwachsene_tu
+        See :func:`anz_erwachsene_tu`.
+
+    Returns
+    -------
+
+    """
+    out = eink_st_tu / anz_erwachsene_tu / 12
+
+    return out
+
+
 def kinderfreib_günstiger_tu(
     eink_st_ohne_kinderfreib_tu: float,
     eink_st_mit_kinderfreib_tu: float,
@@ -1,4 +1,5 @@
 from _gettsim.piecewise_functions import piecewise_polynomial
+from _gettsim.shared import skip_vectorization
 
 
 def soli_st_tu(
@@ -50,3 +51,26 @@ def soli_st_tu(
     )
 
     return out
+
+
+@skip_vectorization
+def _soli_st_erwachsener_m(soli_st_tu: float, anz_erwachsene_tu: int) -> float:
+    """Calculate the monthly solidarity surcharge per adult.
+
+    The solidarity surcharge is split equally between the adults of the tax unit. The
+    result is used to compute net incomes for several transfers.
+
+    Parameters
+    ----------
+    soli_st_tu
+        See :func:`soli_st_tu`.
+    anz_erwachsene_tu
+        See :func:`anz_erwachsene_tu`.
+
+    Returns
+    -------
+
+    """
+    out = soli_st_tu / anz_erwachsene_tu / 12
+
+    return out
@@ -1,6 +1,8 @@
-from _gettsim.shared import add_rounding_spec
+from _gettsim.config import numpy_or_jax as np
+from _gettsim.shared import add_rounding_spec, skip_vectorization
 
 
+@skip_vectorization
 def vorsorgeaufw_alter_tu(
     ges_rentenv_beitr_m_tu: float,
     priv_rentenv_beitr_m_tu: float,
@@ -36,11 +38,12 @@ def vorsorgeaufw_alter_tu(
         - ges_rentenv_beitr_m_tu
     ) * 12
     max_value = anz_erwachsene_tu * eink_st_abzuege_params["vorsorge_altersaufw_max"]
-    out = min(out, max_value)
+    out = np.minimum(out, max_value)
 
     return out
 
 
+@skip_vectorization
 def _vorsorge_alternative_tu_ab_2005_bis_2009(  # noqa: PLR0913
     vorsorgeaufw_alter_tu: float,
     ges_krankenv_beitr_m_tu: float,
@@ -79,13 +82,14 @@ def _vorsorge_alternative_tu_ab_2005_bis_2009(  # noqa: PLR0913
     )
     max_value = anz_erwachsene_tu * eink_st_abzuege_params["vorsorge_sonstige_aufw_max"]
 
-    sum_vorsorge = min(sum_vorsorge, max_value)
+    sum_vorsorge = np.minimum(sum_vorsorge, max_value)
     out = sum_vorsorge + vorsorgeaufw_alter_tu
 
     return out
 
 
 @add_rounding_spec(params_key="eink_st_abzuege")
+@skip_vectorization
 def vorsorgeaufw_tu_ab_2005_bis_2009(
     _vorsorge_alternative_tu_ab_2005_bis_2009: float,
     vorsorgeaufw_tu_bis_2004: float,
@@ -107,12 +111,15 @@ def vorsorgeaufw_tu_ab_2005_bis_2009(
     -------
 
     """
-    out = max(vorsorgeaufw_tu_bis_2004, _vorsorge_alternative_tu_ab_2005_bis_2009)
+    out = np.maximum(
+        vorsorgeaufw_tu_bis_2004, _vorsorge_alternative_tu_ab_2005_bis_2009
+    )
 
     return out
 
 
 @add_rounding_spec(params_key="eink_st_abzuege")
+@skip_vectorization
 def vorsorgeaufw_tu_ab_2010_bis_2019(
     vorsorgeaufw_tu_bis_2004: float, vorsorgeaufw_tu_ab_2020: float
 ) -> float:
@@ -137,12 +144,13 @@ def vorsorgeaufw_tu_ab_2010_bis_2019(
     -------
 
     """
-    out = max(vorsorgeaufw_tu_bis_2004, vorsorgeaufw_tu_ab_2020)
+    out = np.maximum(vorsorgeaufw_tu_bis_2004, vorsorgeaufw_tu_ab_2020)
 
     return out
 
 
 @add_rounding_spec(params_key="eink_st_abzuege")
+@skip_vectorization
 def vorsorgeaufw_tu_ab_2020(  # noqa: PLR0913
     vorsorgeaufw_alter_tu: float,
     ges_pflegev_beitr_m_tu: float,
@@ -185,19 +193,20 @@ def vorsorgeaufw_tu_ab_2020(  # noqa: PLR0913
     sonst_vors_max = (
         eink_st_abzuege_params["vorsorge_sonstige_aufw_max"] * anz_erwachsene_tu
     )
-    sonst_vors_before_basiskrankenv = min(
+    sonst_vors_before_basiskrankenv = np.minimum(
         12 * (arbeitsl_v_beitr_m_tu + ges_pflegev_beitr_m_tu + ges_krankenv_beitr_m_tu),
         sonst_vors_max,
     )
 
     # Basiskrankenversicherung can always be deducted even if above sonst_vors_max
-    sonst_vors = max(basiskrankenversicherung, sonst_vors_before_basiskrankenv)
+    sonst_vors = np.maximum(basiskrankenversicherung, sonst_vors_before_basiskrankenv)
 
     out = sonst_vors + vorsorgeaufw_alter_tu
     return out
 
 
 @add_rounding_spec(params_key="eink_st_abzuege")
+@skip_vectorization
 def vorsorgeaufw_tu_bis_2004(
     _vorsorgeaufw_vom_lohn_tu_bis_2004: float,
     ges_krankenv_beitr_m_tu: float,
@@ -226,7 +235,9 @@ def vorsorgeaufw_tu_bis_2004(
     -------
 
     """
-    multiplikator1 = max(
+    grundhöchstbetrag = eink_st_abzuege_params["vorsorge_2004_grundhöchstbetrag"]
+
+    multiplikator1 = np.maximum(
         (
             12 * (ges_rentenv_beitr_m_tu + ges_krankenv_beitr_m_tu)
             - _vorsorgeaufw_vom_lohn_tu_bis_2004
@@ -234,29 +245,26 @@ def vorsorgeaufw_tu_bis_2004(
         0.0,
     )
 
-    item_1 = (1 / anz_erwachsene_tu) * multiplikator1
+    item_1 = multiplikator1 / anz_erwachsene_tu
 
-    if item_1 > eink_st_abzuege_params["vorsorge_2004_grundhöchstbetrag"]:
-        multiplikator2 = eink_st_abzuege_params["vorsorge_2004_grundhöchstbetrag"]
-    else:
-        multiplikator2 = item_1
+    multiplikator2 = np.where(item_1 > grundhöchstbetrag, grundhöchstbetrag, item_1)
 
-    item_2 = (1 / anz_erwachsene_tu) * multiplikator2
+    item_2 = multiplikator2 / anz_erwachsene_tu
 
-    hoechstgrenze_item3 = (
-        anz_erwachsene_tu * eink_st_abzuege_params["vorsorge_2004_grundhöchstbetrag"]
-    )
+    hoechstgrenze_item3 = anz_erwachsene_tu * grundhöchstbetrag
 
-    if (item_1 - item_2) > hoechstgrenze_item3:
-        item_3 = 0.5 * hoechstgrenze_item3
-    else:
-        item_3 = 0.5 * (item_1 - item_2)
+    item_3 = 0.5 * np.where(
+        (item_1 - item_2) > hoechstgrenze_item3,
+        hoechstgrenze_item3,
+        item_1 - item_2,
+    )
 
     out = _vorsorgeaufw_vom_lohn_tu_bis_2004 + item_2 + item_3
 
     return out
 
 
+@skip_vectorization
 def _vorsorgeaufw_vom_lohn_tu_bis_2004(
     bruttolohn_m_tu: float,
     gemeinsam_veranlagt_tu: bool,
@@ -277,19 +285,17 @@ def _vorsorgeaufw_vom_lohn_tu_bis_2004(
     -------
 
     """
-    if gemeinsam_veranlagt_tu:
-        out = 0.5 * (
-            2 * eink_st_abzuege_params["vorsorge2004_vorwegabzug"]
-            - eink_st_abzuege_params["vorsorge2004_kürzung_vorwegabzug"]
-            * 12
-            * bruttolohn_m_tu
-        )
-    else:
-        out = (
-            eink_st_abzuege_params["vorsorge2004_vorwegabzug"]
-            - eink_st_abzuege_params["vorsorge2004_kürzung_vorwegabzug"]
-            * 12
-            * bruttolohn_m_tu
-        )
-
-    return max(out, 0.0)
+    vorwegabzug = eink_st_abzuege_params["vorsorge2004_vorwegabzug"]
+    kürzung = (
+        eink_st_abzuege_params["vorsorge2004_kürzung_vorwegabzug"]
+        * 12
+        * bruttolohn_m_tu
+    )
+
+    out = np.where(
+        gemeinsam_veranlagt_tu,
+        0.5 * (2 * vorwegabzug - kürzung),
+        vorwegabzug - kürzung,
+    )
+
+    return np.maximum(out, 0.0)
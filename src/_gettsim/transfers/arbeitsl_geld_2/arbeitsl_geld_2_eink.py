@@ -1,11 +1,10 @@
 from _gettsim.piecewise_functions import piecewise_polynomial
 
 
-def arbeitsl_geld_2_eink_m(  # noqa: PLR0913
+def arbeitsl_geld_2_eink_m(
     arbeitsl_geld_2_bruttoeink_m: float,
-    eink_st_tu: float,
-    soli_st_tu: float,
-    anz_erwachsene_tu: int,
+    _eink_st_erwachsener_m: float,
+    _soli_st_erwachsener_m: float,
     sozialv_beitr_m: float,
     arbeitsl_geld_2_eink_anr_frei_m: float,
     kind: bool,
@@ -21,12 +20,10 @@ def arbeitsl_geld_2_eink_m(  # noqa: PLR0913
         See :func:`arbeitsl_geld_2_eink_m`.
     sozialv_beitr_m
         See :func:`sozialv_beitr_m`.
-    eink_st_tu
-        See :func:`eink_st_tu`.
-    soli_st_tu
-        See :func:`soli_st_tu`.
-    anz_erwachsene_tu
-        See :func:`anz_erwachsene_tu`.
+    _eink_st_erwachsener_m
+        See :func:`_eink_st_erwachsener_m`.
+    _soli_st_erwachsener_m
+        See :func:`_soli_st_erwachsener_m`.
     arbeitsl_geld_2_eink_anr_frei_m
         See :func:`arbeitsl_geld_2_eink_anr_frei_m`.
     kind
@@ -50,8 +47,8 @@ def arbeitsl_geld_2_eink_m(  # noqa: PLR0913
     else:
         out = (
             arbeitsl_geld_2_bruttoeink_m
-            - (eink_st_tu / anz_erwachsene_tu / 12)
-            - (soli_st_tu / anz_erwachsene_tu / 12)
+            - _eink_st_erwachsener_m
+            - _soli_st_erwachsener_m
             - sozialv_beitr_m
             - arbeitsl_geld_2_eink_anr_frei_m
         )
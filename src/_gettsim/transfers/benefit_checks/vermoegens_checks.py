@@ -1,3 +1,8 @@
+from _gettsim.config import numpy_or_jax as np
+from _gettsim.shared import skip_vectorization
+
+
+@skip_vectorization
 def _kinderzuschl_nach_vermög_check_m_tu(
     _kinderzuschl_vor_vermög_check_m_tu: float,
     vermögen_bedürft_hh: float,
@@ -19,17 +24,19 @@ def _kinderzuschl_nach_vermög_check_m_tu(
 
     """
 
-    if vermögen_bedürft_hh > arbeitsl_geld_2_vermög_freib_hh:
-        out = max(
+    out = np.where(
+        vermögen_bedürft_hh > arbeitsl_geld_2_vermög_freib_hh,
+        np.maximum(
             _kinderzuschl_vor_vermög_check_m_tu
             - (vermögen_bedürft_hh - arbeitsl_geld_2_vermög_freib_hh),
             0.0,
-        )
-    else:
-        out = _kinderzuschl_vor_vermög_check_m_tu
+        ),
+        _kinderzuschl_vor_vermög_check_m_tu,
+    )
     return out
 
 
+@skip_vectorization
 def wohngeld_nach_vermög_check_m_hh(
     wohngeld_vor_vermög_check_m_hh: float,
     vermögen_bedürft_hh: float,
@@ -57,13 +64,13 @@ def wohngeld_nach_vermög_check_m_hh(
 
     """
 
-    if vermögen_bedürft_hh <= (
-        wohngeld_params["vermögensgrundfreibetrag"]
-        + (wohngeld_params["vermögensfreibetrag_pers"] * (haushaltsgröße_hh - 1))
-    ):
-        out = wohngeld_vor_vermög_check_m_hh
-    else:
-        out = 0.0
+    vermög_freib = wohngeld_params["vermögensgrundfreibetrag"] + (
+        wohngeld_params["vermögensfreibetrag_pers"] * (haushaltsgröße_hh - 1)
+    )
+
+    out = np.where(
+        vermögen_bedürft_hh <= vermög_freib, wohngeld_vor_vermög_check_m_hh, 0.0
+    )
 
     return out
 
@@ -265,9 +265,8 @@ def _elterngeld_anz_mehrlinge_anspruch(
 
 def elterngeld_nettolohn_m(
     bruttolohn_m: float,
-    eink_st_tu: float,
-    soli_st_tu: float,
-    anz_erwachsene_tu: int,
+    _eink_st_erwachsener_m: float,
+    _soli_st_erwachsener_m: float,
     sozialv_beitr_m: float,
 ) -> float:
     """Calculate the net wage.
@@ -279,12 +278,10 @@ def elterngeld_nettolohn_m(
     ----------
     bruttolohn_m
         See basic input variable :ref:`bruttolohn_m <bruttolohn_m>`.
-    eink_st_tu
-        See :func:`eink_st_tu`.
-    soli_st_tu
-        See :func:`soli_st_tu`.
-    anz_erwachsene_tu
-        See :func:`anz_erwachsene_tu`.
+    _eink_st_erwachsener_m
+        See :func:`_eink_st_erwachsener_m`.
+    _soli_st_erwachsener_m
+        See :func:`_soli_st_erwachsener_m`.
     sozialv_beitr_m
         See :func:`sozialv_beitr_m`.
 
@@ -293,10 +290,7 @@ def elterngeld_nettolohn_m(
 
     """
     out = (
-        bruttolohn_m
-        - (eink_st_tu / anz_erwachsene_tu / 12)
-        - (soli_st_tu / anz_erwachsene_tu / 12)
-        - sozialv_beitr_m
+        bruttolohn_m - _eink_st_erwachsener_m - _soli_st_erwachsener_m - sozialv_beitr_m
     )
 
     return max(out, 0.0)
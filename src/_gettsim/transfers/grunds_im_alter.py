@@ -1,6 +1,9 @@
+from _gettsim.config import numpy_or_jax as np
 from _gettsim.piecewise_functions import piecewise_polynomial
+from _gettsim.shared import skip_vectorization
 
 
+@skip_vectorization
 def grunds_im_alter_m_hh(  # noqa: PLR0913
     arbeitsl_geld_2_regelbedarf_m_hh: float,
     _grunds_im_alter_mehrbedarf_schwerbeh_g_m_hh: float,
@@ -49,24 +52,25 @@ def grunds_im_alter_m_hh(  # noqa: PLR0913
 
     # Wealth check
     # Only pay Grundsicherung im Alter if all adults are retired (see docstring)
-    if (vermögen_bedürft_hh >= grunds_im_alter_vermög_freib_hh) or (
-        not erwachsene_alle_rentner_hh
-    ):
-        out = 0.0
-    else:
-        # Subtract income
-        out = (
-            arbeitsl_geld_2_regelbedarf_m_hh
-            + _grunds_im_alter_mehrbedarf_schwerbeh_g_m_hh
-            - grunds_im_alter_eink_m_hh
-            - kind_unterh_erhalt_m_hh
-            - unterhaltsvors_m_hh
-            - kindergeld_m_hh
-        )
-
-    return max(out, 0.0)
+    kein_anspruch = np.logical_or(
+        vermögen_bedürft_hh >= grunds_im_alter_vermög_freib_hh,
+        np.logical_not(erwachsene_alle_rentner_hh),
+    )
+
+    # Subtract income. The first sum is a new array, hence the augmented assignments
+    # reuse it instead of allocating a temporary array for each term.
+    out = (
+        arbeitsl_geld_2_regelbedarf_m_hh + _grunds_im_alter_mehrbedarf_schwerbeh_g_m_hh
+    )
+    out -= grunds_im_alter_eink_m_hh
+    out -= kind_unterh_erhalt_m_hh
+    out -= unterhaltsvors_m_hh
+    out -= kindergeld_m_hh
+
+    return np.where(kein_anspruch, 0.0, np.maximum(out, 0.0))
 
 
+@skip_vectorization
 def grunds_im_alter_eink_m(  # noqa: PLR0913
     grunds_im_alter_erwerbseink_m: float,
     grunds_im_alter_priv_rente_m: float,
@@ -74,9 +78,8 @@ def grunds_im_alter_eink_m(  # noqa: PLR0913
     sonstig_eink_m: float,
     eink_vermietung_m: float,
     _grunds_im_alter_kapitaleink_brutto_m: float,
-    eink_st_tu: float,
-    soli_st_tu: float,
-    anz_erwachsene_tu: int,
+    _eink_st_erwachsener_m: float,
+    _soli_st_erwachsener_m: float,
     sozialv_beitr_m: float,
     elterngeld_anr_m: float,
 ) -> float:
@@ -97,12 +100,10 @@ def grunds_im_alter_eink_m(  # noqa: PLR0913
         See :func:`eink_vermietung_m`.
     _grunds_im_alter_kapitaleink_brutto_m
         See :func:`_grunds_im_alter_kapitaleink_brutto_m`.
-    eink_st_tu
-        See :func:`eink_st_tu`.
-    soli_st_tu
-        See :func:`soli_st_tu`.
-    anz_erwachsene_tu
-        See :func:`anz_erwachsene_tu`.
+    _eink_st_erwachsener_m
+        See :func:`_eink_st_erwachsener_m`.
+    _soli_st_erwachsener_m
+        See :func:`_soli_st_erwachsener_m`.
     sozialv_beitr_m
         See :func:`sozialv_beitr_m`.
     elterngeld_anr_m
@@ -127,15 +128,13 @@ def grunds_im_alter_eink_m(  # noqa: PLR0913
     # subtract taxes and social insurance contributions
     # TODO: Change this to lohnsteuer
     out = (
-        total_income
-        - (eink_st_tu / anz_erwachsene_tu / 12)
-        - (soli_st_tu / anz_erwachsene_tu / 12)
-        - sozialv_beitr_m
+        total_income - _eink_st_erwachsener_m - _soli_st_erwachsener_m - sozialv_beitr_m
     )
 
-    return max(out, 0.0)
+    return np.maximum(out, 0.0)
 
 
+@skip_vectorization
 def grunds_im_alter_erwerbseink_m(
     bruttolohn_m: float,
     eink_selbst_m: float,
@@ -172,11 +171,12 @@ def grunds_im_alter_erwerbseink_m(
     earnings_after_max_deduction = earnings - arbeitsl_geld_2_params["regelsatz"][1] / 2
     earnings = (1 - grunds_im_alter_params["erwerbseink_anr_frei"]) * earnings
 
-    out = max(earnings, earnings_after_max_deduction)
+    out = np.maximum(earnings, earnings_after_max_deduction)
 
     return out
 
 
+@skip_vectorization
 def _grunds_im_alter_kapitaleink_brutto_m(
     kapitaleink_brutto: float,
     grunds_im_alter_params: dict,
@@ -204,12 +204,15 @@ def _grunds_im_alter_kapitaleink_brutto_m(
         kapitaleink_brutto - grunds_im_alter_params["kapitaleink_anr_frei"]
     )
 
-    # Calculate and return monthly capital income (after deduction)
-    out = max(0.0, capital_income_y / 12)
+    # Calculate and return monthly capital income (after deduction). Missing values
+    # become zero.
+    capital_income_m = capital_income_y / 12
+    out = np.where(capital_income_m > 0, capital_income_m, 0.0)
 
     return out
 
 
+@skip_vectorization
 def grunds_im_alter_priv_rente_m(
     priv_rente_m: float,
     arbeitsl_geld_2_params: dict,
@@ -244,11 +247,12 @@ def grunds_im_alter_priv_rente_m(
     )
     upper = arbeitsl_geld_2_params["regelsatz"][1] / 2
 
-    out = priv_rente_m - min(priv_rente_m_amount_exempt, upper)
+    out = priv_rente_m - np.minimum(priv_rente_m_amount_exempt, upper)
 
     return out
 
 
+@skip_vectorization
 def _grunds_im_alter_mehrbedarf_schwerbeh_g_m(
     schwerbeh_g: bool,
     anz_erwachsene_hh: int,
@@ -279,16 +283,14 @@ def _grunds_im_alter_mehrbedarf_schwerbeh_g_m(
         grunds_im_alter_params["mehrbedarf_schwerbeh_g"]
     )
 
-    if (schwerbeh_g) and (anz_erwachsene_hh == 1):
-        out = mehrbedarf_single
-    elif (schwerbeh_g) and (anz_erwachsene_hh > 1):
-        out = mehrbedarf_in_couple
-    else:
-        out = 0.0
+    out = np.where(anz_erwachsene_hh == 1, mehrbedarf_single, 0.0)
+    out = np.where(anz_erwachsene_hh > 1, mehrbedarf_in_couple, out)
+    out = np.where(schwerbeh_g, out, 0.0)
 
     return out
 
 
+@skip_vectorization
 def grunds_im_alter_ges_rente_m_bis_2020(
     ges_rente_m: float,
 ) -> float:
@@ -309,6 +311,7 @@ def grunds_im_alter_ges_rente_m_bis_2020(
     return ges_rente_m
 
 
+@skip_vectorization
 def grunds_im_alter_ges_rente_m_ab_2021(
     ges_rente_m: float,
     grundr_berechtigt: bool,
@@ -348,14 +351,14 @@ def grunds_im_alter_ges_rente_m_ab_2021(
     )
 
     upper = arbeitsl_geld_2_params["regelsatz"][1] / 2
-    if grundr_berechtigt:
-        angerechnete_rente = min(angerechnete_rente, upper)
-    else:
-        angerechnete_rente = 0.0
+    angerechnete_rente = np.where(
+        grundr_berechtigt, np.minimum(angerechnete_rente, upper), 0.0
+    )
 
     return ges_rente_m - angerechnete_rente
 
 
+@skip_vectorization
 def grunds_im_alter_vermög_freib_hh(
     anz_erwachsene_hh: int,
     anz_kinder_hh: int,
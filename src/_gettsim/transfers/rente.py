@@ -1,5 +1,6 @@
+from _gettsim.config import numpy_or_jax as np
 from _gettsim.piecewise_functions import piecewise_polynomial
-from _gettsim.shared import add_rounding_spec
+from _gettsim.shared import add_rounding_spec, skip_vectorization
 
 
 def sum_ges_rente_priv_rente_m(priv_rente_m: float, ges_rente_m: float) -> float:
@@ -48,6 +49,7 @@ def ges_rente_nach_grundr_m(
 
 
 @add_rounding_spec(params_key="ges_rente")
+@skip_vectorization
 def ges_rente_vor_grundr_m(
     ges_rente_zugangsfaktor: float,
     entgeltp_update: float,
@@ -83,14 +85,12 @@ def ges_rente_vor_grundr_m(
     """
 
     # Return 0 if person not yet retired
-    if rentner:
-        out = entgeltp_update * ges_rente_zugangsfaktor * rentenwert
-    else:
-        out = 0.0
+    out = np.where(rentner, entgeltp_update * ges_rente_zugangsfaktor * rentenwert, 0.0)
 
     return out
 
 
+@skip_vectorization
 def rentenwert(wohnort_ost: bool, ges_rente_params: dict) -> float:
     """Select the rentenwert depending on place of living.
 
@@ -107,11 +107,12 @@ def rentenwert(wohnort_ost: bool, ges_rente_params: dict) -> float:
     """
     params = ges_rente_params["rentenwert"]
 
-    out = params["ost"] if wohnort_ost else params["west"]
+    out = np.where(wohnort_ost, float(params["ost"]), float(params["west"]))
 
-    return float(out)
+    return out
 
 
+@skip_vectorization
 def rentenwert_vorjahr(wohnort_ost: bool, ges_rente_params: dict) -> float:
     """Select the rentenwert of the last year depending on place of living.
 
@@ -128,9 +129,9 @@ def rentenwert_vorjahr(wohnort_ost: bool, ges_rente_params: dict) -> float:
     """
     params = ges_rente_params["rentenwert_vorjahr"]
 
-    out = params["ost"] if wohnort_ost else params["west"]
+    out = np.where(wohnort_ost, float(params["ost"]), float(params["west"]))
 
-    return float(out)
+    return out
 
 
 def entgeltp_update(entgeltp: float, entgeltp_update_lohn: float) -> float:
@@ -159,6 +160,7 @@ def entgeltp_update(entgeltp: float, entgeltp_update_lohn: float) -> float:
     return out
 
 
+@skip_vectorization
 def entgeltp_update_lohn(
     bruttolohn_m: float,
     wohnort_ost: bool,
@@ -186,18 +188,16 @@ def entgeltp_update_lohn(
     # ToDo: had been earned during GDR times?
 
     # Scale bruttolohn up if earned in eastern Germany
-    if wohnort_ost:
-        bruttolohn_scaled_east = (
-            bruttolohn_m * ges_rente_params["umrechnung_entgeltp_beitrittsgebiet"]
-        )
-    else:
-        bruttolohn_scaled_east = bruttolohn_m
+    bruttolohn_scaled_east = np.where(
+        wohnort_ost,
+        bruttolohn_m * ges_rente_params["umrechnung_entgeltp_beitrittsgebiet"],
+        bruttolohn_m,
+    )
 
     # Calculate the (scaled) wage, which is subject to pension contributions.
-    if bruttolohn_scaled_east > _ges_rentenv_beitr_bemess_grenze_m:
-        bruttolohn_scaled_rentenv = _ges_rentenv_beitr_bemess_grenze_m
-    else:
-        bruttolohn_scaled_rentenv = bruttolohn_scaled_east
+    bruttolohn_scaled_rentenv = np.minimum(
+        bruttolohn_scaled_east, _ges_rentenv_beitr_bemess_grenze_m
+    )
 
     # Calculate monthly mean wage in Germany
     durchschnittslohn_m = (1 / 12) * ges_rente_params[
@@ -208,6 +208,7 @@ def entgeltp_update_lohn(
     return out
 
 
+@skip_vectorization
 def ges_rente_zugangsfaktor(  # noqa: PLR0913
     geburtsjahr: int,
     rentner: bool,
@@ -258,50 +259,47 @@ def ges_rente_zugangsfaktor(  # noqa: PLR0913
 
     """
 
-    if rentner and ges_rente_vorauss_regelrente:
-        # Early retirement (before full retirement age): Zugangsfaktor < 1
-        if (
-            jahr_renteneintr - geburtsjahr
-        ) < _ges_rente_altersgrenze_abschlagsfrei:  # [ERA,FRA)
-            if ges_rente_vorauss_vorzeitig:
-                # Calc difference to FRA of pensions with early retirement options
-                # (Altersgrenze langjährig Versicherte, Altersrente für Frauen).
-                out = (
-                    1
-                    + ((jahr_renteneintr - geburtsjahr) - referenz_alter_abschlag)
-                    * ges_rente_params["zugangsfaktor_veränderung_pro_jahr"][
-                        "vorzeitiger_renteneintritt"
-                    ]
-                )
-            else:
-                # Early retirement although not eligible to do so.
-                # ToDo: Implement early retirment for disabled or long-term unemployed
-                out = 0.0
-
-        # Late retirement (after normal retirement age/Regelaltersgrenze):
-        # Zugangsfaktor > 1
-        elif (jahr_renteneintr - geburtsjahr) > ges_rente_regelaltersgrenze:
-            out = (
-                1
-                + ((jahr_renteneintr - geburtsjahr) - ges_rente_regelaltersgrenze)
-                * ges_rente_params["zugangsfaktor_veränderung_pro_jahr"][
-                    "späterer_renteneintritt"
-                ]
-            )
-
-        # Retirement between full retirement age and normal retirement age:
-        else:  # [FRA,NRA]
-            out = 1.0
-
-    # Return 0 if person not yet retired or retired before working at least 5 years
-    else:
-        out = 0.0
-
-    out = max(out, 0.0)
+    alter_renteneintritt = jahr_renteneintr - geburtsjahr
+    veränderung_pro_jahr = ges_rente_params["zugangsfaktor_veränderung_pro_jahr"]
+
+    # The Zugangsfaktor changes linearly in the difference to a reference age:
+    # - Early retirement (before full retirement age): Zugangsfaktor < 1. Calc
+    #   difference to FRA of pensions with early retirement options (Altersgrenze
+    #   langjährig Versicherte, Altersrente für Frauen).
+    # - Late retirement (after normal retirement age/Regelaltersgrenze):
+    #   Zugangsfaktor > 1
+    # - Retirement between full retirement age and normal retirement age [FRA,NRA]:
+    #   Zugangsfaktor of 1
+    vorzeitig = alter_renteneintritt < _ges_rente_altersgrenze_abschlagsfrei
+    später = alter_renteneintritt > ges_rente_regelaltersgrenze
+    differenz = np.where(
+        vorzeitig,
+        alter_renteneintritt - referenz_alter_abschlag,
+        np.where(später, alter_renteneintritt - ges_rente_regelaltersgrenze, 0.0),
+    )
+    veränderung = np.where(
+        vorzeitig,
+        veränderung_pro_jahr["vorzeitiger_renteneintritt"],
+        veränderung_pro_jahr["späterer_renteneintritt"],
+    )
+    out = 1 + differenz * veränderung
+
+    # Return 0 if person not yet retired or retired before working at least 5 years.
+    # Early retirement although not eligible to do so leads to a Zugangsfaktor of 0.
+    # ToDo: Implement early retirment for disabled or long-term unemployed
+    anspruch = np.logical_and.reduce(
+        [
+            rentner,
+            ges_rente_vorauss_regelrente,
+            np.logical_or(np.logical_not(vorzeitig), ges_rente_vorauss_vorzeitig),
+        ]
+    )
+    out = np.where(anspruch, np.maximum(out, 0.0), 0.0)
 
     return out
 
 
+@skip_vectorization
 def _ges_rente_altersgrenze_abschlagsfrei(  # noqa: PLR0913
     ges_rente_regelaltersgrenze: float,
     ges_rente_frauen_altersgrenze: float,
@@ -343,15 +341,17 @@ def _ges_rente_altersgrenze_abschlagsfrei(  # noqa: PLR0913
 
     """
 
-    out = float("Nan")
-    if ges_rente_vorauss_regelrente:
-        out = ges_rente_regelaltersgrenze
-    if ges_rente_vorauss_frauen:
-        out = min([out, ges_rente_frauen_altersgrenze])
-    if ges_rente_vorauss_langj:
-        out = min([out, _ges_rente_langj_altersgrenze])
-    if ges_rente_vorauss_besond_langj:
-        out = min([out, _ges_rente_besond_langj_altersgrenze])
+    out = np.where(ges_rente_vorauss_regelrente, ges_rente_regelaltersgrenze, np.nan)
+
+    # Lower the age threshold if a person is eligible for another pension type with a
+    # lower threshold. Comparisons with NaN are False, hence people not eligible for
+    # the regular pension keep NaN.
+    for vorauss, altersgrenze in [
+        (ges_rente_vorauss_frauen, ges_rente_frauen_altersgrenze),
+        (ges_rente_vorauss_langj, _ges_rente_langj_altersgrenze),
+        (ges_rente_vorauss_besond_langj, _ges_rente_besond_langj_altersgrenze),
+    ]:
+        out = np.where(np.logical_and(vorauss, altersgrenze < out), altersgrenze, out)
 
     return out
 
@@ -394,6 +394,7 @@ def referenz_alter_abschlag(
     return out
 
 
+@skip_vectorization
 def ges_rente_regelaltersgrenze(geburtsjahr: int, ges_rente_params: dict) -> float:
     """Calculates the age, at which a person is eligible to claim the regular pension.
     Normal retirement age (NRA). This pension cannot be claimed earlier than at the NRA,
@@ -424,6 +425,7 @@ def ges_rente_regelaltersgrenze(geburtsjahr: int, ges_rente_params: dict) -> flo
     return out
 
 
+@skip_vectorization
 def ges_rente_frauen_altersgrenze(
     geburtsjahr: int,
     geburtsmonat: int,
@@ -450,10 +452,7 @@ def ges_rente_frauen_altersgrenze(
     """
     # From 1945 on, the altersgrenze of women is equal to the Regelaltersgrenze which
     # is indpendendent of the birth month and only depends on the birth year.
-    if geburtsjahr < 1945:
-        x = geburtsjahr + (geburtsmonat - 1) / 12
-    else:
-        x = geburtsjahr
+    x = np.where(geburtsjahr < 1945, geburtsjahr + (geburtsmonat - 1) / 12, geburtsjahr)
 
     out = piecewise_polynomial(
         x=x,
@@ -469,6 +468,7 @@ def ges_rente_frauen_altersgrenze(
     return out
 
 
+@skip_vectorization
 def _ges_rente_langj_altersgrenze(
     geburtsjahr: int,
     geburtsmonat: int,
@@ -497,10 +497,7 @@ def _ges_rente_langj_altersgrenze(
     # From 1951 on, the altersgrenze of langjährig Versicherte is equal to the
     # Regelaltersgrenze which is indpendendent of the birth month and only depends on
     # the birth year.
-    if geburtsjahr < 1951:
-        x = geburtsjahr + (geburtsmonat - 1) / 12
-    else:
-        x = geburtsjahr
+    x = np.where(geburtsjahr < 1951, geburtsjahr + (geburtsmonat - 1) / 12, geburtsjahr)
 
     out = piecewise_polynomial(
         x=x,
@@ -516,6 +513,7 @@ def _ges_rente_langj_altersgrenze(
     return out
 
 
+@skip_vectorization
 def _ges_rente_besond_langj_altersgrenze(
     geburtsjahr: int,
     geburtsmonat: int,
@@ -539,10 +537,7 @@ def _ges_rente_besond_langj_altersgrenze(
     Full retirement age (without deductions) for very long term insured.
 
     """
-    if geburtsjahr < 1952:
-        x = geburtsjahr + (geburtsmonat - 1) / 12
-    else:
-        x = geburtsjahr
+    x = np.where(geburtsjahr < 1952, geburtsjahr + (geburtsmonat - 1) / 12, geburtsjahr)
 
     out = piecewise_polynomial(
         x=x,
@@ -603,6 +598,7 @@ def ges_rente_vorauss_regelrente(ges_rente_wartezeit_5: float) -> bool:
     return out
 
 
+@skip_vectorization
 def ges_rente_vorauss_frauen(  # noqa: PLR0913
     weiblich: bool,
     ges_rente_wartezeit_15: float,
@@ -643,16 +639,19 @@ def ges_rente_vorauss_frauen(  # noqa: PLR0913
         ]["intercepts_at_lower_thresholds"],
     )
 
-    out = (
-        weiblich
-        and ges_rente_wartezeit_15 >= 15
-        and y_pflichtbeitr_ab_40 >= 10
-        and alter >= altersgrenze_vorzeitig
+    out = np.logical_and.reduce(
+        [
+            weiblich,
+            ges_rente_wartezeit_15 >= 15,
+            y_pflichtbeitr_ab_40 >= 10,
+            alter >= altersgrenze_vorzeitig,
+        ]
     )
 
     return out
 
 
+@skip_vectorization
 def ges_rente_vorauss_langj(
     ges_rente_wartezeit_35: float,
     alter: int,
@@ -675,8 +674,9 @@ def ges_rente_vorauss_langj(
     Eligibility as bool.
 
     """
-    out = (alter >= ges_rente_params["altersgrenze_langj_versicherte_vorzeitig"]) and (
-        ges_rente_wartezeit_35 >= 35
+    out = np.logical_and(
+        alter >= ges_rente_params["altersgrenze_langj_versicherte_vorzeitig"],
+        ges_rente_wartezeit_35 >= 35,
     )
 
     return out
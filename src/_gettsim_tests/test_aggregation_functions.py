@@ -244,6 +244,24 @@ def test_grouped_sum(column_to_aggregate, group_id, expected_res_sum):
     numpy.testing.assert_array_almost_equal(result, expected_res_sum)
 
 
+@pytest.mark.parametrize(
+    "column_to_aggregate, expected_dtype_kind",
+    [
+        (np.array([1, 2, 3]), "i"),
+        (np.array([True, False, True]), "i"),
+        (np.array([1.5, 2.0, 3.0]), "f"),
+    ],
+)
+def test_grouped_sum_keeps_kind_of_dtype(column_to_aggregate, expected_dtype_kind):
+    result = grouped_sum(column_to_aggregate, np.array([0, 1, 0]))
+    assert result.dtype.kind == expected_dtype_kind
+
+
+def test_grouped_sum_of_booleans_does_not_overflow():
+    result = grouped_sum(np.ones(200, dtype=bool), np.zeros(200, dtype=int))
+    assert (result * 1000 == 200_000).all()
+
+
 @parameterize_based_on_dict(
     test_grouped_specs,
     keys_of_test_cases=[
@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import textwrap
 
+import numpy
+import pytest
 from _gettsim.config import RESOURCE_DIR
-from _gettsim.functions_loader import _load_functions
+from _gettsim.functions_loader import (
+    _load_functions,
+    _reorder_ids,
+    _vectorize_func,
+)
+from _gettsim.shared import skip_vectorization
 
 
 def func():
@@ -50,3 +57,37 @@ def test_special_attribute_module_is_set_for_internal_functions():
     function = out[list(out)[0]]
 
     assert function.__module__ == "_gettsim.social_insurance_contributions.eink_grenzen"
+
+
+def test_skip_vectorization_decorator():
+    @skip_vectorization
+    def test_func():
+        pass
+
+    assert test_func.__info__["skip_vectorization"]
+
+
+def test_vectorize_func_is_called_once_for_arrays_if_skip_vectorization():
+    calls = []
+
+    @skip_vectorization
+    def test_func(x):
+        calls.append(x)
+        return numpy.where(x > 1, x, 0)
+
+    out = _vectorize_func(test_func)(numpy.arange(4))
+
+    assert len(calls) == 1
+    numpy.testing.assert_array_equal(out, [0, 0, 2, 3])
+
+
+@pytest.mark.parametrize(
+    "ids, expected",
+    [
+        (numpy.array([7, 3, 7, 100]), numpy.array([1, 0, 1, 2])),
+        (numpy.array([0, 1, 2]), numpy.array([0, 1, 2])),
+        (numpy.array([10**9, 10**9]), numpy.array([0, 0])),
+    ],
+)
+def test_reorder_ids(ids, expected):
+    numpy.testing.assert_array_equal(_reorder_ids(ids), expected)
@@ -10,9 +10,12 @@ from _gettsim.functions_loader import (
 from _gettsim.gettsim_typing import convert_series_to_internal_type
 from _gettsim.interface import (
     _convert_data_to_correct_types,
+    _convert_series_to_numpy,
     _fail_if_columns_overriding_functions_are_not_in_data,
     _fail_if_group_variables_not_constant_within_groups,
     _fail_if_pid_is_non_unique,
+    _is_constant_within_groups,
+    _process_and_check_data,
     _round_and_partial_parameters_to_functions,
     compute_taxes_and_transfers,
 )
@@ -118,6 +121,99 @@ def test_fail_if_group_variables_not_constant_within_groups():
         _fail_if_group_variables_not_constant_within_groups(data)
 
 
+@pytest.mark.parametrize(
+    "series, expected_dtype",
+    [
+        (pd.Series([1, 2, 3], dtype="Int64"), numpy.int64),
+        (pd.Series([1.5, 2.5]), numpy.float64),
+        (pd.DataFrame(numpy.ones((3, 2)))[0], numpy.float64),
+        (pd.Series([True, False], dtype="boolean"), numpy.bool_),
+    ],
+)
+def test_convert_series_to_numpy(series, expected_dtype):
+    result = _convert_series_to_numpy(series)
+
+    assert result.dtype == expected_dtype
+    assert result.flags["C_CONTIGUOUS"]
+    numpy.testing.assert_array_equal(result, series.to_numpy(dtype=expected_dtype))
+
+
+def test_sparse_group_ids_give_same_result_as_consecutive_ids():
+    data = pd.DataFrame(
+        {
+            "p_id": [0, 1, 2, 3],
+            "hh_id": [10**9, 5, 10**9, 5],
+            "a": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    aggregation_specs = {"a_hh": {"source_col": "a", "aggr": "sum"}}
+
+    result_sparse = compute_taxes_and_transfers(
+        data, {}, {}, aggregation_specs=aggregation_specs, targets="a_hh"
+    )
+    result_consecutive = compute_taxes_and_transfers(
+        data.assign(hh_id=[1, 0, 1, 0]),
+        {},
+        {},
+        aggregation_specs=aggregation_specs,
+        targets="a_hh",
+    )
+
+    numpy.testing.assert_array_equal(result_sparse["a_hh"], [4.0, 6.0, 4.0, 6.0])
+    pd.testing.assert_frame_equal(result_sparse, result_consecutive)
+
+
+def test_user_functions_receive_original_group_ids():
+    def my_hh_id(hh_id: int) -> int:
+        return hh_id
+
+    data = pd.DataFrame(
+        {
+            "p_id": [0, 1, 2, 3],
+            "hh_id": [1001, 1002, 1001, 1002],
+            "a": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    aggregation_specs = {"a_hh": {"source_col": "a", "aggr": "sum"}}
+
+    result = compute_taxes_and_transfers(
+        data,
+        {},
+        functions=[my_hh_id],
+        aggregation_specs=aggregation_specs,
+        targets=["my_hh_id", "a_hh"],
+    )
+
+    numpy.testing.assert_array_equal(result["my_hh_id"], [1001, 1002, 1001, 1002])
+    numpy.testing.assert_array_equal(result["a_hh"], [4.0, 6.0, 4.0, 6.0])
+
+
+@pytest.mark.parametrize(
+    "values, group_ids, expected",
+    [
+        (numpy.array([1, 2, 1, 2]), numpy.array([0, 1, 0, 1]), True),
+        (numpy.array([1, 2, 2, 2]), numpy.array([0, 1, 0, 1]), False),
+        (numpy.array([1.5, 1.5, 3.0]), numpy.array([5, 5, 2]), True),
+        (numpy.array([True, False]), numpy.array([0, 0]), False),
+    ],
+)
+def test_is_constant_within_groups(values, group_ids, expected):
+    assert _is_constant_within_groups(values, group_ids) == expected
+
+
+def test_fail_if_more_than_one_tax_unit_in_household():
+    data = pd.DataFrame(
+        {
+            "p_id": [1, 2, 3],
+            "tu_id": [1, 2, 3],
+            "hh_id": [1, 1, 2],
+        }
+    )
+
+    with pytest.raises(AssertionError, match="only one tax unit"):
+        _process_and_check_data(data, columns_overriding_functions=[])
+
+
 def test_missing_root_nodes_raises_error(minimal_input_data):
     def b(a):
         return a
@@ -0,0 +1,58 @@
+import numpy
+import pytest
+from _gettsim.piecewise_functions import piecewise_polynomial
+
+PARAMS = {
+    "thresholds": numpy.array([-numpy.inf, 10, 20, numpy.inf]),
+    "rates": numpy.array([[0, 0.5, 2]]),
+    "intercepts_at_lower_thresholds": numpy.array([0, 0, 5]),
+}
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (-5.0, 0.0),
+        (10.0, 0.0),
+        (15.0, 2.5),
+        (20.0, 5.0),
+        (25.0, 15.0),
+    ],
+)
+def test_piecewise_polynomial_scalar(x, expected):
+    assert piecewise_polynomial(x, **PARAMS) == expected
+
+
+@pytest.mark.parametrize("rates_multiplier", [None, numpy.array([1, 2, 0.5, 1, 3])])
+def test_piecewise_polynomial_array_equals_scalar(rates_multiplier):
+    x = numpy.array([-5.0, 10.0, 15.0, 20.0, 25.0])
+
+    result = piecewise_polynomial(x, **PARAMS, rates_multiplier=rates_multiplier)
+
+    multipliers = [None] * len(x) if rates_multiplier is None else rates_multiplier
+    expected = [
+        piecewise_polynomial(x_i, **PARAMS, rates_multiplier=m_i)
+        for x_i, m_i in zip(x, multipliers)
+    ]
+    numpy.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "thresholds",
+    [
+        numpy.array([-numpy.inf, 10, 20, numpy.inf]),
+        numpy.array([0, 10, 20, numpy.inf]),
+    ],
+)
+@pytest.mark.parametrize("rates_multiplier", [None, 2.0])
+def test_piecewise_polynomial_scalar_equals_array(thresholds, rates_multiplier):
+    params = {**PARAMS, "thresholds": thresholds}
+    x = numpy.array([-5.0, 0.0, 5.0, 10.0, 15.0, 20.0, 25.0])
+
+    result = piecewise_polynomial(x, **params, rates_multiplier=rates_multiplier)
+
+    expected = [
+        piecewise_polynomial(x_i, **params, rates_multiplier=rates_multiplier)
+        for x_i in x
+    ]
+    numpy.testing.assert_array_equal(result, expected)